@@ -1,5 +1,6 @@
 from datetime import date
-import time
+import functools
+import heapq
 import subprocess
 import webbrowser
 
@@ -16,29 +17,40 @@ class Backfill:
 
     MAX_CONCURRENT_TASKS = 8
     YAML_FILE = project_dbtwiz_path("backfill-cloudrun.yaml")
+    # Job names may not contain underscores or plus signs
+    JOB_NAME_TRANSLATION = str.maketrans({"_": "-", "+": None})
 
 
     @classmethod
     def backfill_job_name(cls, selector: str) -> str:
         """Generate job name based on the given dbt selector"""
         max_len = 64
-        name = selector.replace("_", "-").replace("+", "")
-        while len(name) > max_len:
-            prev_len = len(name)
-            words = name.split("-")
-            longest_word = max(words, key=len)
-            longest_word_idx = words.index(longest_word)
+        name = selector.translate(cls.JOB_NAME_TRANSLATION)
+        if len(name) <= max_len:
+            return name
+        # Remove empty words
+        words = [w for w in name.split("-") if len(w) > 0]
+        name_len = len("-".join(words))
+        # Max-heap on word length, ties going to the first word, so that
+        # the longest word is found without rescanning all the words
+        heap = [(-len(word), idx) for idx, word in enumerate(words)]
+        heapq.heapify(heap)
+        while len(heap) > 0:
+            _, longest_word_idx = heapq.heappop(heap)
+            longest_word = words[longest_word_idx]
             half_word = halve_str(longest_word)
-            words[longest_word_idx] = half_word
-            # Remove empty words
-            words = [w for w in words if len(w) > 0]
-            name = "-".join(words)
-            if len(name) == prev_len:
+            if len(half_word) >= len(longest_word):
                 # Couldn't shorten the name further by halving the longest word
-                # so remove the last word
-                words.pop()
-                name = "-".join(words)
-        return name
+                break
+            words[longest_word_idx] = half_word
+            name_len -= len(longest_word) - len(half_word)
+            if name_len <= max_len:
+                break
+            heapq.heappush(heap, (-len(half_word), longest_word_idx))
+        # Remove words from the end until the name is short enough
+        while name_len > max_len:
+            name_len -= len(words.pop()) + 1
+        return "-".join(words)
 
 
     @classmethod
@@ -57,25 +69,27 @@ class Backfill:
         if full_refresh:
             assert number_of_days == 1
             assert '+' not in selector
+        config = project_config()
         job_spec_yaml = cls.job_spec_template().render(
             job_name=job_name,
             parallelism=parallelism,
             task_count=number_of_days,
-            image=project_config().dbt_image_url,
+            image=config.dbt_image_url,
             selector=selector,
             start_date=date_first.strftime("%Y-%m-%d"),
             full_refresh=full_refresh,
-            service_account=project_config().dbt_service_account,
-            gcp_region=project_config().gcp_region,
+            service_account=config.dbt_service_account,
+            gcp_region=config.gcp_region,
         )
-        with open(cls.YAML_FILE, "w+") as f:
+        with open(cls.YAML_FILE, "w") as f:
             f.write(job_spec_yaml)
         return job_name
 
 
     @classmethod
+    @functools.cache
     def job_spec_template(cls):
-        """Templated YAML for Cloud Run job specification"""
+        """Templated YAML for Cloud Run job specification, compiled once"""
         yaml = """
         apiVersion: run.googleapis.com/v1
         kind: Job
@@ -122,10 +136,7 @@ class Backfill:
         """Run the given command in a subprocess"""
         if verbose:
             debug(f"Running command: {' '.join(args)}")
-        result = subprocess.run(args)
-        if check:
-            result.check_returncode()
-        return result
+        return subprocess.run(args, check=check)
 
 
     @classmethod
@@ -148,8 +159,9 @@ class Backfill:
 
         ensure_auth()
 
-        gcp_project = project_config().gcp_project
-        gcp_region = project_config().gcp_region
+        config = project_config()
+        gcp_project = config.gcp_project
+        gcp_region = config.gcp_region
 
         info("Preparing job for execution.")
         cls.run_command(
@@ -169,8 +181,8 @@ class Backfill:
         )
         info(f"Job status page: {job_url}")
         if status:
+            # Browsers are launched detached from this process, so there's no need to wait
             webbrowser.open(job_url)
-            time.sleep(0.5)
 
 
 def halve_str(word: str) -> str:
@@ -1,21 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 import json
 import os
 from pathlib import Path
 
-from google.cloud import storage
-
 from .auth import ensure_auth
 from .config import project_config, project_dbtwiz_path
 from .dbt import dbt_invoke
-from .logging import info, debug, error, fatal
+from .logging import info, debug, fatal
 from .manifest import Manifest
+from .support import InvalidArgumentsError
 
 
 class Build():
 
-    VALID_TARGETS = ["dev", "build", "prod-ci", "prod"]
-
     LAST_SELECT_FILE = project_dbtwiz_path("last_select.json")
 
 
@@ -36,31 +34,22 @@ class Build():
         if target == "dev":
             ensure_auth()
 
-        if target != "dev" or Manifest.can_select_directly(select):
-            chosen_models = [select]
-        elif repeat_last:
+        if repeat_last:
             chosen_models = cls.load_selected_models()
+        elif target != "dev" or Manifest.can_select_directly(select):
+            chosen_models = [select]
         else:
-            Manifest().update_models_info()
+            Manifest.instance().update_models_info()
             chosen_models = Manifest.choose_models(select, work=work)
 
         if chosen_models is None:
-            error("No models chosen.")
-            return
+            raise InvalidArgumentsError("No models chosen.")
 
         cls.save_selected_models(chosen_models)
 
-        select = ""
-        chosen_models_with_deps = [
-            "".join([
-                "+" if upstream else "",
-                model,
-                "+" if downstream else ""
-            ])
-            for model in chosen_models
-        ]
-
-        select = " ".join(chosen_models_with_deps)
+        prefix = "+" if upstream else ""
+        suffix = "+" if downstream else ""
+        select = " ".join(f"{prefix}{model}{suffix}" for model in chosen_models)
         debug(f"Select: '{select}'")
 
         if use_task_index:
@@ -73,7 +62,7 @@ class Build():
         commands = ["build"]
         args = {
             "target": target,
-            "vars": f"{{data_interval_start: \"{date}\"}}",
+            "vars": json.dumps({"data_interval_start": date.isoformat()}),
         }
 
         if len(select) > 0:
@@ -85,8 +74,7 @@ class Build():
             args["defer"] = True
             args["state"] = project_config().pod_manifest_path
         else:
-            error("Selector is required with dev target.")
-            return
+            raise InvalidArgumentsError("Selector is required with dev target.")
 
         if full_refresh:
             info("Full refresh requested.")
@@ -100,23 +88,38 @@ class Build():
 
         if save_state and target != "dev":
             info("Saving state, uploading manifest to bucket.")
-            gcs = storage.Client(project=project_config().gcp_project)
-            bucket = gcs.bucket(project_config().dbt_state_bucket)
-            for filename in ["manifest.json", "run_results.json"]:
-                bucket.blob(filename).upload_from_filename(Path.cwd() / "target" / filename)
+            cls.upload_state(["manifest.json", "run_results.json"])
+
+
+    @classmethod
+    def upload_state(cls, filenames):
+        """Upload the given dbt artifacts to the state bucket, in parallel"""
+        from google.cloud import storage  # Only when used
+        gcs = storage.Client(project=project_config().gcp_project)
+        bucket = gcs.bucket(project_config().dbt_state_bucket)
+
+        def upload(filename):
+            bucket.blob(filename).upload_from_filename(Path.cwd() / "target" / filename)
+
+        with ThreadPoolExecutor(max_workers=len(filenames)) as executor:
+            # Consume the results so that a failed upload raises here
+            list(executor.map(upload, filenames))
 
 
     @classmethod
     def save_selected_models(cls, models):
-        with open(cls.LAST_SELECT_FILE, "w+") as f:
-            f.write(json.dumps(models))
+        # Write to a temporary file and move it into place, so that an
+        # interrupted write can't leave a truncated selection behind
+        tmp_file = cls.LAST_SELECT_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(models, f)
+        os.replace(tmp_file, cls.LAST_SELECT_FILE)
 
 
     @classmethod
     def load_selected_models(cls):
         if not cls.LAST_SELECT_FILE.exists():
-            error("No previously selected models found.")
-            return None
+            raise InvalidArgumentsError("No previously selected models found.")
         with open(cls.LAST_SELECT_FILE, "r") as f:
-            models = json.loads(f.read())
+            models = json.load(f)
         return models
@@ -2,8 +2,61 @@ from .manifest import Manifest
 from .target import Target
 from .logging import info
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import functools
 from pathlib import Path
-from google.cloud import bigquery
+from typing import Dict, List
+
+
+MAX_CONCURRENT_QUERIES = 16
+
+MATERIALIZATIONS = frozenset(["view", "table", "incremental"])
+
+
+@functools.cache
+def bigquery_client(project: str):
+    """Get a BigQuery client for the given project, reused across calls"""
+    from google.cloud import bigquery  # Only when used
+    return bigquery.Client(project=project)
+
+
+def dataset_locations(project: str, datasets: List[str]) -> Dict[str, List[str]]:
+    """Group the given datasets in a project by their location, skipping missing ones"""
+    wanted = set(datasets)
+    locations = defaultdict(list)
+    # A single listing gives the location of every dataset: it's part of the
+    # datasets.list resource, but DatasetListItem (google-cloud-bigquery 3.x,
+    # checked against 3.46) has no public property for it, so it is read from
+    # the raw resource. Revisit when upgrading the library.
+    for item in bigquery_client(project).list_datasets(project=project):
+        location = item._properties.get("location")
+        if item.dataset_id in wanted and location is not None:
+            locations[location].append(item.dataset_id)
+    return locations
+
+
+def fetch_project_tables(project: str, datasets: List[str]) -> dict:
+    """Fetch names of tables in the given datasets of a project, grouped by dataset"""
+    from google.cloud import bigquery  # Only when used
+    print(f"Fetching datasets and tables for project {project}")
+    tables = dict()
+    # INFORMATION_SCHEMA is regional, so query each region holding any of the datasets
+    for location, location_datasets in dataset_locations(project, datasets).items():
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("project", "STRING", project),
+            bigquery.ArrayQueryParameter("datasets", "STRING", location_datasets),
+        ])
+        result = bigquery_client(project).query(f"""
+            select table_schema, array_agg(table_name) as tables
+            from `region-{location.lower()}`.INFORMATION_SCHEMA.TABLES
+            where table_catalog = @project
+                and table_schema in unnest(@datasets)
+                and table_name not like '%__dbt_tmp_%'
+            group by table_schema
+        """, job_config=job_config).result()
+        tables.update({row["table_schema"]: row["tables"] for row in result})
+    return tables
 
 
 def cleanup_materializations(target: Target):
@@ -13,45 +66,28 @@ def cleanup_materializations(target: Target):
         Manifest.update_manifests()
 
     if target == Target.dev:
-        manifest = Manifest()
+        manifest = Manifest.instance()
     else:
         manifest = Manifest(Manifest.PROD_MANIFEST_PATH)
 
-    manifest_models = [
-        m for m in manifest.models().values()
-        if m["materialized"] in ["view", "table", "incremental"]
-    ]
-
-    data = dict()
-    for model in manifest_models:
-        project, dataset, table = model["database"], model["schema"], model["name"]
-        # manifest_datasets[database] = manifest_datasets.get(database, set()).union({model["schema"]})
-        data[project] = data.get(project, dict())
-        data[project][dataset] = data[project].get(dataset, dict(manifest=[]))
-        data[project][dataset]["manifest"].append(table)
+    data = defaultdict(lambda: defaultdict(lambda: dict(manifest=[], bigquery=[])))
+    for model in manifest.models().values():
+        if model["materialized"] in MATERIALIZATIONS:
+            data[model["database"]][model["schema"]]["manifest"].append(model["name"])
 
-    for project, datasets in data.items():
-        bq = bigquery.Client(project=project)
-        # for dataset in datasets.keys():
-        #     print(f"Looking up tables in {project=}, {dataset=}")
-        #     data[project][dataset]["bigquery"] = [
-        #         t.table_id for t in bq.list_tables(f"{project}.{dataset}")
-        #         if not "__dbt_tmp_" in t.table_id]
-        print(f"Fetching datasets and tables for project {project}")
-        result = bq.query(f"""
-            select table_schema, array_agg(table_name) as tables
-            from region-eu.INFORMATION_SCHEMA.TABLES
-            where table_catalog = '{project}'
-                and table_name not like '%__dbt_tmp_%'
-            group by table_schema
-        """).result()
-        for row in result:
-            dataset = row["table_schema"]
-            data[project][dataset] = data[project].get(dataset, dict(manifest=[]))
-            data[project][dataset]["bigquery"] = row["tables"]
+    # Query projects concurrently, since each query is dominated by waiting on BigQuery
+    projects = list(data.keys())
+    workers = max(1, min(MAX_CONCURRENT_QUERIES, len(projects)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        project_datasets = [list(data[project].keys()) for project in projects]
+        results = executor.map(fetch_project_tables, projects, project_datasets)
+        for project, project_tables in zip(projects, results):
+            for dataset, tables in project_tables.items():
+                data[project][dataset]["bigquery"] = tables
 
     for project, datasets in data.items():
         for dataset, variants in datasets.items():
-            for table in variants["bigquery"]:
-                if table not in variants["manifest"] and len(variants["manifest"]) > 0:
-                    print(f"Not in manifest: {project}.{dataset}.{table}")
+            if len(variants["manifest"]) == 0:
+                continue
+            for table in sorted(set(variants["bigquery"]) - set(variants["manifest"])):
+                print(f"Not in manifest: {project}.{dataset}.{table}")
@@ -1,5 +1,6 @@
 import configparser
 import functools
+import os
 from pathlib import Path
 from typing import Dict, Any
 
@@ -26,6 +27,7 @@ def project_path(target: str = "") -> Path:
     """Get Path to the given target relative to the project root directory"""
     return project_config().root_path() / target
 
+@functools.cache
 def project_dbtwiz_path(target: str = "") -> Path:
     """Get Path to the given target relative to the project .dbtwiz directory"""
     dot_path = project_config().root_path() / ".dbtwiz"
@@ -121,7 +123,7 @@ class UserConfig:
 
     def _write_to_file(self) -> None:
         Path.mkdir(self.CONFIG_PATH, exist_ok=True)
-        with open(self.CONFIG_FILE, "w+") as f:
+        with open(self.CONFIG_FILE, "w") as f:
             self.parser.write(f)
 
 
@@ -162,22 +164,24 @@ class ProjectConfig:
 
     def _determine_root_path(self):
         """Search upward from current path to find project root"""
-        path_list = [Path.cwd()] + list(Path.cwd().parents)
-        for path in path_list:
-            if (path / "pyproject.toml").exists:
-                self.root = path
+        path = os.getcwd()
+        while True:
+            if os.path.isfile(os.path.join(path, "pyproject.toml")):
+                self.root = Path(path)
                 return
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
         fatal("No pyproject.toml file found in current or upstream directories.")
 
     def _parse_config(self):
+        import tomllib  # Only when used
         project_file = self.root_path() / "pyproject.toml"
         try:
-            parser = configparser.ConfigParser()
-            parser.read(project_file)
+            with open(project_file, "rb") as f:
+                config = tomllib.load(f)["tool"]["dbtwiz"]["project"]
             for setting in self.SETTINGS:
-                value = parser.get("tool.dbtwiz.project", setting)
-                if value[0] == value[-1] and value[0] in ["'", '"']:
-                    value = value[1:-1]  # Strip surrounding quotes
-                self.__setattr__(setting, value)
+                self.__setattr__(setting, config[setting])
         except Exception as ex:
             fatal(f"Failed to parse file {project_file}: {ex}")
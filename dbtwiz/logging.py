@@ -18,4 +18,4 @@ def error(message: str):
 
 def fatal(message: str, exit_code=1):
     error_console.print(message, style="red")
-    SystemExit(exit_code)
+    raise SystemExit(exit_code)
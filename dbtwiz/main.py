@@ -3,27 +3,27 @@ import datetime
 import typer
 from typing_extensions import Annotated
 
-from .build import Build
-# from .cleanup import cleanup_materializations
-from .config import UserConfig
-from .test import Test
-from .backfill import Backfill
-from .freshness import Freshness
-from .model import Model
-from .precommit import SqlFix
-from .logging import debug, info, error
-from .manifest import Manifest
+# Command implementations are imported inside each command, so that
+# invoking one command (or --help) doesn't load the dependencies of all
+from .logging import error
 from .target import Target
-from .auth import ensure_auth
+from .support import InvalidArgumentsError
 
 
-class InvalidArgumentsError(ValueError):
-    pass
+def parse_date_or_today(date: str) -> datetime.date:
+    """Parse a YYYY-mm-dd date argument, defaulting to today when empty"""
+    if date == "":
+        return datetime.date.today()
+    try:
+        return datetime.date.fromisoformat(date)
+    except ValueError:
+        raise InvalidArgumentsError("Date must be on the YYYY-mm-dd format.")
 
 
 app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]},
     #add_completion=False,
+    no_args_is_help=True,
 )
 
 
@@ -64,14 +64,9 @@ def build(
 ) -> None:
     """Build dbt models"""
     # Validate
-    try:
-        if date == "":
-            run_date = datetime.date.today()
-        else:
-            run_date = datetime.date.fromisoformat(date)
-    except ValueError:
-        raise InvalidArgumentsError("Date must be on the YYYY-mm-dd format.")
+    run_date = parse_date_or_today(date)
     # Dispatch
+    from .build import Build
     Build.run(
         target.value, select, run_date, use_task_index, save_state,
         full_refresh, upstream, downstream, work, repeat_last
@@ -92,14 +87,9 @@ def test(
 ) -> None:
     """Test dbt models"""
     # Validate
-    try:
-        if date == "":
-            run_date = datetime.date.today()
-        else:
-            run_date = datetime.date.fromisoformat(date)
-    except ValueError:
-        raise InvalidArgumentsError("Date must be on the YYYY-mm-dd format.")
+    run_date = parse_date_or_today(date)
     # Dispatch
+    from .test import Test
     Test.run(target.value, select, run_date)
 
 
@@ -110,6 +100,7 @@ def freshness(
             help="Target")] = Target.dev,
 ) -> None:
     """Run source freshness tests"""
+    from .freshness import Freshness
     Freshness.run(target.value)
 
 
@@ -153,6 +144,7 @@ def backfill(
         if date_last != date_first:
             raise InvalidArgumentsError("Full refresh in only supported on single day runs.")
     # Dispatch
+    from .backfill import Backfill
     Backfill.run(
         select, first_date, last_date, full_refresh,
         parallelism, status, verbose
@@ -165,6 +157,7 @@ def model(
             help="Model name or path")],
 ):
     """Output information about a given model"""
+    from .model import Model
     Model.run(name)
 
 
@@ -175,12 +168,14 @@ def manifest(
         help="Which manifest to get. One of ['all', 'local', 'prod']. Default 'all'.")] = "all",
 ):
     """Update dev and production manifests for fast lookup"""
+    from .manifest import Manifest
     Manifest.update_manifests(type)
 
 
 @app.command()
 def sqlfix():
     """Run sqlfmt-fix and sqlfluff-fix on staged changes"""
+    from .precommit import SqlFix
     SqlFix.run()
 
 
@@ -192,6 +187,7 @@ def config(
             help="Configuration value")],
 ):
     """Update configuration setting"""
+    from .config import UserConfig
     UserConfig.run(key, value)
 
 
@@ -202,6 +198,7 @@ def config(
 #             help="Target")] = Target.dev,
 # ):
 #     """Clean up warehouse by deleting materializations not present in manifest"""
+#     from .cleanup import cleanup_materializations
 #     cleanup_materializations(target)
 
 
@@ -6,8 +6,6 @@ from jinja2 import Template
 from pathlib import Path
 from typing import List
 
-from google.cloud import storage
-
 from .config import project_config, user_config, project_dbtwiz_path
 from .logging import info, debug, error
 from .dbt import dbt_invoke
@@ -23,13 +21,21 @@ class Manifest:
 
 
     @classmethod
+    @functools.cache
+    def instance(cls):
+        """Get the local manifest, parsed only once per command"""
+        return cls()
+
+
+    @classmethod
+    @functools.cache  # Looked up several times per command
     def models_cached(cls):
         """Get dictionary of models in local manifest, with JSON file for caching"""
         if not cls.MODELS_CACHE_PATH.exists() or (
                 cls.MODELS_CACHE_PATH.stat().st_mtime < cls.MANIFEST_PATH.stat().st_mtime
         ):
             debug("Updating models cache")
-            Manifest().update_models_cache()
+            cls.instance().update_models_cache()
         with open(cls.MODELS_CACHE_PATH, "r") as f:
             return json.load(f)
 
@@ -39,12 +45,16 @@ class Manifest:
         """Rebuild local manifest"""
         info("Parsing development manifest")
         dbt_invoke(["parse"], quiet=True)
+        cls.instance.cache_clear()
+        cls.models_cached.cache_clear()
+        cls.can_select_directly.cache_clear()
 
 
     @classmethod
     def get_prod_manifest(cls):
         """Download latest production manifest"""
         info("Fetching production manifest")
+        from google.cloud import storage  # Only when used
         gcs = storage.Client(project=project_config().gcp_project)
         blob = gcs.bucket(project_config().dbt_state_bucket).blob("manifest.json")
         # Create path if missing
@@ -91,13 +101,14 @@ class Manifest:
 
 
     @classmethod
+    @functools.cache
     def can_select_directly(cls, select: str) -> bool:
         """The given select string should be passed on to dbt without interaction"""
         return (
+            # select contains special characters (checked first, as it needs no file access)
+            re.search(r"[:+*, ]", select) is not None or
             # select matches name of an existing model exactly
-            select in cls.models_cached().keys() or
-            # select contains special characters
-            re.search(r"[:+*, ]", select) is not None
+            select in cls.models_cached().keys()
         )
 
 
@@ -112,7 +123,7 @@ class Manifest:
 
     def update_models_cache(self):
         Path.mkdir(self.MODELS_CACHE_PATH.parent, exist_ok=True)
-        with open(self.MODELS_CACHE_PATH, "w+") as f:
+        with open(self.MODELS_CACHE_PATH, "w") as f:
             json.dump(self.models(), f)
 
 
@@ -125,7 +136,7 @@ class Manifest:
                 continue
             debug(f"Rendering model info to {info_file}")
             model_info = self.model_info_template(clear=True).render(model=model)
-            with open(info_file, "w+") as f:
+            with open(info_file, "w") as f:
                 # combine multiple blank lines into one to avoid
                 # painful handling of it in template
                 f.write(re.sub(r"\n\n+", "\n\n", model_info))
@@ -145,7 +156,7 @@ class Manifest:
 
     @functools.cache
     def model_info_template(self, clear=False) -> Template:
-        with open(Path(__file__).parent / "templates" / "model_info.tpl", "r+") as f:
+        with open(Path(__file__).parent / "templates" / "model_info.tpl", "r") as f:
             template = f.read()
         if clear:
             template = "\033[2J\033[H" + template
@@ -20,7 +20,7 @@ class Model:
             error("No model chosen.")
             return
 
-        manifest = Manifest()
+        manifest = Manifest.instance()
         model = manifest.model_by_name(name)
         # print(Manifest().model_info_template().render(model=model))
 
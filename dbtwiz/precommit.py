@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 import subprocess
 
 
@@ -7,9 +7,14 @@ from .logging import info, fatal
 
 class SqlFix():
 
-    QUERY_FOLDERS = [
+    QUERY_FOLDERS = frozenset([
         "models", "macros", "tests", "seeds", "analyses"
-    ]
+    ])
+    # Git always separates paths with forward slashes
+    QUERY_PREFIXES = tuple(f"{folder}/".encode() for folder in QUERY_FOLDERS)
+
+    # Fewer files than this aren't worth the startup cost of parallel workers
+    PARALLEL_MIN_FILES = 4
 
     @classmethod
     def run(cls) -> None:
@@ -22,24 +27,27 @@ class SqlFix():
         subprocess.run(["sqlfmt", "--line-length=100"] + query_files)
 
         info("Running sqlfluff fix on changes SQL files.")
-        subprocess.run(["sqlfluff", "fix"] + query_files)
+        sqlfluff_args = ["sqlfluff", "fix"]
+        if len(query_files) >= cls.PARALLEL_MIN_FILES:
+            # Use all CPUs except one
+            sqlfluff_args.append("--processes=-1")
+        subprocess.run(sqlfluff_args + query_files)
 
 
     @classmethod
     def staged_queries(cls):
-        git_status = subprocess.run([
-            "git", "status", "--short", "--untracked-files=no",
-            "--no-ahead-behind", "--no-renames"
+        # Added or modified files in the index, NUL-separated and relative to
+        # the current directory, so file names need no unquoting or splitting
+        git_diff = subprocess.run([
+            "git", "diff", "--cached", "--name-only", "-z",
+            "--diff-filter=AM", "--no-renames", "--relative"
         ], capture_output=True)
-        if git_status.returncode > 0:
-            fatal(git_status.stderr.decode("utf-8"))
+        if git_diff.returncode > 0:
+            fatal(git_diff.stderr.decode("utf-8"))
 
         query_files = list()
-        for line in git_status.stdout.decode("utf-8").splitlines():
-            staged, *_, filename = line.split(" ")
-            if staged in ["A", "M"]:
-                path = Path(filename)
-                if path.parts[0] in cls.QUERY_FOLDERS and path.suffix == ".sql":
-                    query_files.append(path)
+        for filename in git_diff.stdout.split(b"\0"):
+            if filename.endswith(b".sql") and filename.startswith(cls.QUERY_PREFIXES):
+                query_files.append(os.fsdecode(filename))
 
         return query_files
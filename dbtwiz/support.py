@@ -2,6 +2,10 @@ import subprocess
 from pathlib import Path
 
 
+class InvalidArgumentsError(ValueError):
+    pass
+
+
 def models_with_local_changes(models):
     """Return a list of names of models with local changes according to Git"""
     output = subprocess.check_output(["git", "status", "--porcelain"])
@@ -1,17 +1,16 @@
 from datetime import date
+import json
 
 from .auth import ensure_auth
 from .config import project_config
 from .dbt import dbt_invoke
 from .manifest import Manifest
-from .logging import info, debug, error
+from .logging import info, debug
+from .support import InvalidArgumentsError
 
 
 class Test():
 
-    VALID_TARGETS = ["dev", "build", "prod-ci", "prod"]
-
-
     @classmethod
     def run(cls,
             target: str,
@@ -25,7 +24,7 @@ class Test():
         commands = ["test"]
         args = {
             "target": target,
-            "vars": f"{{data_interval_start: \"{date}\"}}",
+            "vars": json.dumps({"data_interval_start": date.isoformat()}),
         }
 
         models = Manifest.models_cached()
@@ -47,7 +46,6 @@ class Test():
             args["state"] = project_config().pod_manifest_path
         else:
             # Running ALL tests means you'd have to build ALL models - not likely
-            error("Selector is required with dev target.")
-            return
+            raise InvalidArgumentsError("Selector is required with dev target.")
 
         dbt_invoke(commands, **args)